@@ -5,7 +5,8 @@ Common async patterns and utilities for Ghostbusters components.
 """
 
 import asyncio
-from typing import Any, Callable, Optional
+from itertools import islice
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
 
 class AsyncExecutor:
@@ -41,3 +42,77 @@ class AsyncExecutor:
                 if attempt == max_retries:
                     raise
                 await asyncio.sleep(1 * (2**attempt))  # Exponential backoff
+
+    async def execute_many_with_retry(
+        self,
+        operations: List[Callable[[], Awaitable[Any]]],
+        max_retries: Optional[int] = None,
+        timeout: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Any]:
+        """Execute independent async operations concurrently, retrying only failures
+
+        Operations run in batches of ``batch_size`` (all at once by default) under
+        one shared timeout per attempt. Results are returned in input order; if an
+        operation still fails after the last retry, its exception is raised.
+        """
+        max_retries = max_retries or self.default_retries
+        timeout = timeout or self.default_timeout
+        batch_size = batch_size or len(operations)
+
+        results: List[Any] = [None] * len(operations)
+        remaining = iter(enumerate(operations))
+        while True:
+            batch = list(islice(remaining, batch_size))
+            if not batch:
+                return results
+            await self._run_batch_with_retry(batch, results, max_retries, timeout)
+
+    async def _run_batch_with_retry(
+        self,
+        batch: List[Tuple[int, Callable[[], Awaitable[Any]]]],
+        results: List[Any],
+        max_retries: int,
+        timeout: int,
+    ) -> None:
+        """Run one batch, storing successes and re-submitting only failed indices"""
+        pending = batch
+        for attempt in range(max_retries + 1):
+            tasks = {
+                asyncio.ensure_future(self._call(operation)): (index, operation)
+                for index, operation in pending
+            }
+            try:
+                _, timed_out = await asyncio.wait(tasks, timeout=timeout)
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+            if timed_out:
+                # Let the cancelled operations unwind before retrying them
+                await asyncio.wait(timed_out)
+
+            failed = []
+            for task, (index, operation) in tasks.items():
+                if task in timed_out:
+                    failed.append((index, operation, asyncio.TimeoutError()))
+                    continue
+                error = task.exception()
+                if error is None:
+                    results[index] = task.result()
+                elif isinstance(error, Exception):
+                    failed.append((index, operation, error))
+                else:
+                    raise error
+
+            if not failed:
+                return
+            if attempt == max_retries:
+                raise failed[0][2]
+            pending = [(index, operation) for index, operation, _ in failed]
+            await asyncio.sleep(1 * (2**attempt))  # Exponential backoff
+
+    @staticmethod
+    async def _call(operation: Callable[[], Awaitable[Any]]) -> Any:
+        """Invoke an operation inside a task, so synchronous raises become its outcome"""
+        return await operation()
@@ -5,9 +5,25 @@ Standardized confidence calculation and validation for Ghostbusters components.
 This module eliminates duplication of confidence scoring logic across agents, recovery engines, and validators.
 """
 
+import math
+from itertools import chain
+from operator import mul
 from typing import List, Dict, Any
 from pydantic import BaseModel, Field, field_validator
 
+# Per-severity confidence multipliers and the factor each severity contributes
+_SEVERITY_MULTIPLIERS = {"high": 1.2, "medium": 1.0, "low": 0.8}
+_SEVERITY_FACTORS = {
+    "high": "high_severity_penalty",
+    "medium": "medium_severity",
+    "low": "low_severity_penalty",
+}
+
+
+def _clamp01(value: float) -> float:
+    """Clamp a confidence value into [0.0, 1.0]"""
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
 
 class ConfidenceScore(BaseModel):
     """Standardized confidence score with validation"""
@@ -23,11 +39,32 @@ class ConfidenceScore(BaseModel):
         description="Additional metadata about the confidence calculation",
     )
 
-    @field_validator("value")
+    @field_validator("value", mode="before")
     @classmethod
-    def validate_confidence(cls, v: float) -> float:
+    def validate_confidence(cls, v: Any) -> Any:
         """Ensure confidence is between 0.0 and 1.0"""
-        return max(0.0, min(1.0, v))
+        # Clamp before the ge/le constraints run; other input is left to pydantic
+        if isinstance(v, (int, float)):
+            return _clamp01(v)
+        return v
+
+
+def _make_score(
+    value: float, factors: List[str], metadata: Dict[str, Any]
+) -> ConfidenceScore:
+    """
+    Build a ConfidenceScore from locally computed values without re-validation.
+
+    Used where factors/metadata grow with the input: pydantic would otherwise
+    validate every entry again. The value is clamped here instead, and NaN is
+    rejected just as the ge/le constraints would reject it.
+    """
+    value = float(value)
+    if math.isnan(value):
+        raise ValueError("Confidence value must not be NaN")
+    return ConfidenceScore.model_construct(
+        value=_clamp01(value), factors=factors, metadata=metadata
+    )
 
 
 class ConfidenceCalculator:
@@ -57,35 +94,34 @@ class ConfidenceCalculator:
                 },
             )
 
-        # Calculate confidence based on number and severity of delusions
-        total_confidence = 0.0
-        factors = []
-
+        # Calculate confidence based on number and severity of delusions.
+        # One pass buckets raw confidences by severity (unknown severities count
+        # as medium); each bucket is then summed in C and weighted once.
+        buckets = {severity: [] for severity in _SEVERITY_MULTIPLIERS}
+        medium_bucket = buckets["medium"]
         for delusion in delusions:
-            confidence = delusion.get("confidence", 0.5)
-            severity = delusion.get("severity", "medium")
-
-            # Adjust confidence based on severity
-            if severity == "high":
-                confidence *= 1.2
-                factors.append("high_severity_penalty")
-            elif severity == "low":
-                confidence *= 0.8
-                factors.append("low_severity_penalty")
-            else:
-                factors.append("medium_severity")
+            buckets.get(delusion.get("severity", "medium"), medium_bucket).append(
+                delusion.get("confidence", 0.5)
+            )
 
-            total_confidence += confidence
+        total_confidence = 0.0
+        factors = []
+        for severity, confidences in buckets.items():
+            if confidences:
+                total_confidence += _SEVERITY_MULTIPLIERS[severity] * sum(confidences)
+                factors.append(_SEVERITY_FACTORS[severity])
 
-        final_confidence = min(total_confidence / len(delusions), 1.0)
+        delusion_count = len(delusions)
+        average_confidence = total_confidence / delusion_count
+        final_confidence = min(average_confidence, 1.0)
 
         return ConfidenceScore(
             value=final_confidence,
-            factors=factors,
+            factors=sorted(factors),
             metadata={
                 "method": "agent_confidence",
-                "delusion_count": len(delusions),
-                "average_delusion_confidence": total_confidence / len(delusions),
+                "delusion_count": delusion_count,
+                "average_delusion_confidence": average_confidence,
             },
         )
 
@@ -237,7 +273,7 @@ class ConfidenceCalculator:
         Returns:
             Normalized confidence value between 0.0 and 1.0
         """
-        return max(0.0, min(1.0, confidence))
+        return _clamp01(confidence)
 
     @staticmethod
     def combine_confidence_scores(
@@ -248,7 +284,8 @@ class ConfidenceCalculator:
 
         Args:
             scores: List of confidence scores to combine
-            weights: Optional weights for each score (must sum to 1.0)
+            weights: Optional weights for each score (normalized to sum to 1.0;
+                their sum must be positive)
 
         Returns:
             Combined confidence score
@@ -261,35 +298,35 @@ class ConfidenceCalculator:
             )
 
         if weights is None:
-            # Equal weights if none provided
+            # Equal weights if none provided (already normalized)
             weights = [1.0 / len(scores)] * len(scores)
+        else:
+            if len(weights) != len(scores):
+                raise ValueError("Number of weights must match number of scores")
 
-        if len(weights) != len(scores):
-            raise ValueError("Number of weights must match number of scores")
-
-        # Normalize weights to sum to 1.0
-        weight_sum = sum(weights)
-        if weight_sum != 0:
+            # Normalize weights to sum to 1.0
+            weight_sum = sum(weights)
+            if weight_sum <= 0:
+                raise ValueError("Weights must sum to a positive value")
             weights = [w / weight_sum for w in weights]
 
         # Calculate weighted average
-        combined_value = sum(
-            score.value * weight for score, weight in zip(scores, weights)
-        )
+        values = [score.value for score in scores]
+        combined_value = sum(map(mul, values, weights))
 
-        # Combine all factors
-        all_factors = []
-        for score in scores:
-            all_factors.extend(score.factors)
+        # Combine all factors, keeping the first occurrence of each
+        all_factors = list(
+            dict.fromkeys(chain.from_iterable(score.factors for score in scores))
+        )
 
         # Combine metadata
         combined_metadata = {
             "method": "combined_confidence",
             "score_count": len(scores),
             "weights": weights,
-            "individual_scores": [score.value for score in scores],
+            "individual_scores": values,
         }
 
-        return ConfidenceScore(
+        return _make_score(
             value=combined_value, factors=all_factors, metadata=combined_metadata
         )
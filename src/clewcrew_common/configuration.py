@@ -5,7 +5,43 @@ Environment and configuration management for Ghostbusters components.
 """
 
 import os
-from typing import Any, Optional
+import pickle
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Optional
+
+_MISSING = object()
+
+# Serialises the resource_tracker.register swap in _open_untracked_shared_memory
+_REGISTER_SWAP_LOCK = threading.Lock()
+
+
+def _open_untracked_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Open an existing shared memory block without registering it for cleanup
+
+    The attaching process does not own the block; if it were registered, its
+    resource tracker would unlink the block when the process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Before 3.13 SharedMemory always registers; skip it for this block only.
+    # Unregistering afterwards is not an option: forked workers share the
+    # parent's tracker, so that would drop the owner's registration too.
+    block_name = name.lstrip("/")
+    with _REGISTER_SWAP_LOCK:
+        register = resource_tracker.register
+
+        def register_others(resource_name: str, rtype: str) -> None:
+            if rtype != "shared_memory" or resource_name.lstrip("/") != block_name:
+                register(resource_name, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
 
 
 class ConfigManager:
@@ -15,6 +51,9 @@ class ConfigManager:
         """Initialize configuration manager"""
         self.config_file = config_file
         self._config_cache = {}
+        # Environment-derived values, converted once per (key, type_hint)
+        self._resolved_cache: Dict[str, Dict[Optional[type], Any]] = {}
+        self._snapshot: Optional[shared_memory.SharedMemory] = None
 
     def get(
         self,
@@ -23,9 +62,20 @@ class ConfigManager:
         required: bool = False,
         type_hint: Optional[type] = None,
     ) -> Any:
-        """Get configuration value with fallback to default"""
+        """Get configuration value with fallback to default
+
+        Values read from the environment are cached after type conversion; call
+        invalidate() if the environment changes at runtime.
+        """
+        cached = self._resolved_cache.get(key, {}).get(type_hint, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         # Check environment variables first
-        value = os.getenv(key, default)
+        value = os.environ.get(key)
+        from_env = value is not None
+        if not from_env:
+            value = default
 
         # Check config file if specified
         if value is None and self.config_file:
@@ -45,6 +95,9 @@ class ConfigManager:
             except (ValueError, TypeError) as e:
                 raise ValueError(f"Invalid type for configuration '{key}': {e}")
 
+        if from_env:
+            self._resolved_cache.setdefault(key, {})[type_hint] = value
+
         return value
 
     def _get_from_file(self, key: str, default: Any) -> Any:
@@ -65,10 +118,71 @@ class ConfigManager:
     def set(self, key: str, value: Any):
         """Set configuration value (for testing/debugging)"""
         self._config_cache[key] = value
+        self.invalidate(key)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop cached environment lookups for a key, or for all keys"""
+        if key is None:
+            self._resolved_cache.clear()
+        else:
+            self._resolved_cache.pop(key, None)
 
     def has(self, key: str) -> bool:
         """Check if configuration key exists"""
-        return os.getenv(key) is not None or key in self._config_cache
+        return key in os.environ or key in self._config_cache
+
+    def snapshot(self, name: str = "clewcrew_cfg") -> str:
+        """Publish the resolved configuration to shared memory for worker processes
+
+        Workers call ConfigManager.attach(name) instead of re-reading and
+        re-converting the environment. The block lives until release_snapshot().
+        Block names are system-wide: pass a distinct name per snapshot when more
+        than one manager or application publishes at the same time.
+        """
+        self.release_snapshot()
+        payload = pickle.dumps(
+            (self.config_file, self._config_cache, self._resolved_cache)
+        )
+        try:
+            shm = shared_memory.SharedMemory(
+                create=True, size=len(payload) + 8, name=name
+            )
+        except FileExistsError as e:
+            raise FileExistsError(
+                f"Configuration snapshot '{name}' already exists; release it from "
+                "the process that created it or choose another name"
+            ) from e
+        shm.buf[:8] = len(payload).to_bytes(8, "little")
+        shm.buf[8 : 8 + len(payload)] = payload
+        self._snapshot = shm
+        return shm.name
+
+    def release_snapshot(self) -> None:
+        """Free the shared memory block created by snapshot(), if any"""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot.unlink()
+            self._snapshot = None
+
+    @classmethod
+    def attach(cls, name: str = "clewcrew_cfg") -> "ConfigManager":
+        """Create a configuration manager from a snapshot published by snapshot()
+
+        Works from any process, not only children of the snapshotting one: the
+        block is not registered with this process's resource tracker.
+        """
+        shm = _open_untracked_shared_memory(name)
+        try:
+            size = int.from_bytes(shm.buf[:8], "little")
+            payload = bytes(shm.buf[8 : 8 + size])
+        finally:
+            shm.close()
+
+        config_file, config_cache, resolved_cache = pickle.loads(payload)
+        manager = cls(config_file)
+        manager._config_cache = config_cache
+        manager._resolved_cache = resolved_cache
+        return manager
 
 
 # Global configuration instance
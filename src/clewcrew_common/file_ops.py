@@ -4,8 +4,24 @@ File Operations
 Common file and path operations for Ghostbusters components.
 """
 
+import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Pattern
+
+# Files above this size are read through pathlib instead of one os.read call
+_SINGLE_READ_LIMIT = 8 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+@lru_cache(maxsize=64)
+def _compile_name_pattern(pattern: str) -> Pattern[str]:
+    """Compile a single-component glob pattern the way pathlib matches it"""
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
 
 
 class FileOperations:
@@ -15,10 +31,30 @@ class FileOperations:
     def read_file_safe(file_path: str) -> str:
         """Safely read a file with error handling"""
         try:
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                fd = os.open(file_path, _READ_FLAGS)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {file_path}")
-            return path.read_text(encoding="utf-8")
+            try:
+                size = os.fstat(fd).st_size
+                if size > _SINGLE_READ_LIMIT:
+                    data = Path(file_path).read_bytes()
+                else:
+                    # st_size may be short (or zero) for special files; drain to EOF
+                    chunks = [os.read(fd, size)] if size else []
+                    chunk = os.read(fd, _READ_CHUNK_SIZE)
+                    while chunk:
+                        chunks.append(chunk)
+                        chunk = os.read(fd, _READ_CHUNK_SIZE)
+                    data = b"".join(chunks)
+            finally:
+                os.close(fd)
+
+            text = data.decode("utf-8")
+            if "\r" in text:
+                # Keep the universal newline translation read_text applied
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
         except Exception as e:
             raise IOError(f"Error reading file {file_path}: {e}")
 
@@ -36,9 +72,11 @@ class FileOperations:
     @staticmethod
     def ensure_directory(directory_path: str) -> bool:
         """Ensure a directory exists, creating it if necessary"""
+        # Fast path: the directory usually exists already
+        if os.path.isdir(directory_path):
+            return True
         try:
-            path = Path(directory_path)
-            path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory_path, exist_ok=True)
             return True
         except Exception as e:
             raise IOError(f"Error creating directory {directory_path}: {e}")
@@ -47,9 +85,19 @@ class FileOperations:
     def list_files(directory_path: str, pattern: str = "*.py") -> List[Path]:
         """List files in a directory matching a pattern"""
         try:
-            path = Path(directory_path)
-            if not path.exists():
-                return []
-            return list(path.glob(pattern))
+            if "**" in pattern or "/" in pattern or os.sep in pattern:
+                path = Path(directory_path)
+                if not path.exists():
+                    return []
+                return [p for p in path.glob(pattern) if p.is_file()]
+
+            match = _compile_name_pattern(pattern).match
+            # Path("") means the current directory; os.scandir("") would raise
+            with os.scandir(directory_path or ".") as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if match(entry.name) and entry.is_file()
+                ]
         except Exception:
             return []
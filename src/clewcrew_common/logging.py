@@ -12,32 +12,69 @@ from typing import Any, Dict, Optional
 from pathlib import Path
 
 
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is when a record is emitted"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        # sys.stdout is resolved on every emit, so redirects are always honoured
+        pass
+
+
+# One stdout handler shared by every component logger
+_SHARED_HANDLER = _StdoutHandler()
+_SHARED_HANDLER.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+
+# Level names accepted by ClewcrewLogger, matching the logging module constants
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# Component loggers, so repeated construction skips the logging manager lock
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
 class ClewcrewLogger:
     """Unified logger for Ghostbusters components"""
 
     def __init__(self, component_name: str, log_level: str = "INFO"):
         """Initialize the logger for a component"""
         self.component_name = component_name
-        self.logger = logging.getLogger(f"ghostbusters.{component_name}")
+        self.logger = _LOGGERS.get(component_name)
+        if self.logger is None:
+            self.logger = logging.getLogger(f"ghostbusters.{component_name}")
+            _LOGGERS[component_name] = self.logger
 
         # Set log level
-        level = getattr(logging, log_level.upper(), logging.INFO)
+        level = _LEVELS.get(log_level.upper(), logging.INFO)
         self.logger.setLevel(level)
 
         # Add handler if none exists
         if not self.logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            self.logger.addHandler(_SHARED_HANDLER)
 
     def info(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log info message with optional context"""
         if context:
-            message = f"{message} | Context: {context}"
-        self.logger.info(message)
+            self.logger.info("%s | Context: %s", message, context)
+        else:
+            self.logger.info(message)
 
     def warning(
         self,
@@ -47,28 +84,32 @@ class ClewcrewLogger:
     ):
         """Log warning message with severity and optional context"""
         if context:
-            message = f"{message} | Severity: {severity} | Context: {context}"
+            self.logger.warning(
+                "%s | Severity: %s | Context: %s", message, severity, context
+            )
         else:
-            message = f"{message} | Severity: {severity}"
-        self.logger.warning(message)
+            self.logger.warning("%s | Severity: %s", message, severity)
 
     def error(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log error message with optional context"""
         if context:
-            message = f"{message} | Context: {context}"
-        self.logger.error(message)
+            self.logger.error("%s | Context: %s", message, context)
+        else:
+            self.logger.error(message)
 
     def debug(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log debug message with optional context"""
         if context:
-            message = f"{message} | Context: {context}"
-        self.logger.debug(message)
+            self.logger.debug("%s | Context: %s", message, context)
+        else:
+            self.logger.debug(message)
 
     def critical(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log critical message with optional context"""
         if context:
-            message = f"{message} | Context: {context}"
-        self.logger.critical(message)
+            self.logger.critical("%s | Context: %s", message, context)
+        else:
+            self.logger.critical(message)
 
 
 class LoggingConfig:
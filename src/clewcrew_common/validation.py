@@ -5,7 +5,10 @@ Common validation patterns for Ghostbusters components.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+# Matched with fullmatch so a trailing newline is not accepted the way "$" allows
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 
 
 class ValidationUtils:
@@ -14,8 +17,12 @@ class ValidationUtils:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email address format"""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
+        return _EMAIL_RE.fullmatch(email) is not None
+
+    @staticmethod
+    def filter_valid_emails(emails: Iterable[str]) -> List[str]:
+        """Filter emails down to the addresses with a valid format, keeping order"""
+        return list(filter(_EMAIL_RE.fullmatch, emails))
 
     @staticmethod
     def validate_required_fields(
@@ -0,0 +1,168 @@
+"""
+Tests for the async utilities module.
+"""
+
+import asyncio
+
+import pytest
+from clewcrew_common.async_utils import AsyncExecutor
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Skip the exponential backoff sleeps between retries."""
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(delay, *args, **kwargs):
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+
+
+def counting_operation(calls, index, result, failures=0):
+    """Build an operation that records its calls and fails `failures` times."""
+
+    async def operation():
+        calls[index] = calls.get(index, 0) + 1
+        if calls[index] <= failures:
+            raise RuntimeError(f"operation {index} failed")
+        return result
+
+    return operation
+
+
+class TestExecuteManyWithRetry:
+    """Test AsyncExecutor.execute_many_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, no_backoff):
+        """Test results are returned in the order of the operations."""
+        calls = {}
+        operations = [counting_operation(calls, i, i * 10) for i in range(5)]
+
+        results = await AsyncExecutor().execute_many_with_retry(operations)
+        assert results == [0, 10, 20, 30, 40]
+
+    @pytest.mark.asyncio
+    async def test_empty_operations(self):
+        """Test an empty operation list returns an empty result list."""
+        assert await AsyncExecutor().execute_many_with_retry([]) == []
+
+    @pytest.mark.asyncio
+    async def test_retries_only_failed_indices(self, no_backoff):
+        """Test successful operations are not run again."""
+        calls = {}
+        operations = [
+            counting_operation(calls, 0, "a"),
+            counting_operation(calls, 1, "b", failures=2),
+            counting_operation(calls, 2, "c"),
+        ]
+
+        results = await AsyncExecutor().execute_many_with_retry(operations)
+        assert results == ["a", "b", "c"]
+        assert calls == {0: 1, 1: 3, 2: 1}
+
+    @pytest.mark.asyncio
+    async def test_raises_after_last_retry(self, no_backoff):
+        """Test an operation that keeps failing raises its exception."""
+        calls = {}
+        operations = [
+            counting_operation(calls, 0, "a"),
+            counting_operation(calls, 1, "b", failures=10),
+        ]
+
+        with pytest.raises(RuntimeError, match="operation 1 failed"):
+            await AsyncExecutor().execute_many_with_retry(operations, max_retries=2)
+        assert calls == {0: 1, 1: 3}
+
+    @pytest.mark.asyncio
+    async def test_retries_synchronous_raise(self, no_backoff):
+        """Test an operation raising before returning a coroutine is retried."""
+        attempts = []
+
+        async def succeed():
+            return "ok"
+
+        def operation():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("not ready")
+            return succeed()
+
+        results = await AsyncExecutor().execute_many_with_retry([operation])
+        assert results == ["ok"]
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_error_is_not_retried(self, no_backoff):
+        """Test a CancelledError outcome is re-raised instead of retried."""
+        attempts = []
+
+        async def operation():
+            attempts.append(1)
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await AsyncExecutor().execute_many_with_retry([operation])
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_size_chunks_operations(self, no_backoff):
+        """Test at most batch_size operations run concurrently."""
+        running = 0
+        peak = 0
+
+        def make_operation(index):
+            async def operation():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+                return index
+
+            return operation
+
+        operations = [make_operation(i) for i in range(5)]
+        results = await AsyncExecutor().execute_many_with_retry(
+            operations, batch_size=2
+        )
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_retries_only_pending(self, no_backoff):
+        """Test a timeout re-runs only the operations that had not finished."""
+        calls = {"fast": 0, "slow": 0}
+
+        async def fast():
+            calls["fast"] += 1
+            return "fast"
+
+        async def slow():
+            calls["slow"] += 1
+            if calls["slow"] == 1:
+                await asyncio.Event().wait()
+            return "slow"
+
+        results = await AsyncExecutor().execute_many_with_retry(
+            [fast, slow], timeout=0.05
+        )
+        assert results == ["fast", "slow"]
+        assert calls == {"fast": 1, "slow": 2}
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_after_last_retry(self, no_backoff):
+        """Test an operation that always times out raises TimeoutError."""
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await AsyncExecutor().execute_many_with_retry(
+                [hang], max_retries=1, timeout=0.01
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -53,6 +53,33 @@ class TestConfidenceCalculator:
         assert "high_severity_penalty" in confidence.factors
         assert "medium_severity" in confidence.factors
 
+    def test_calculate_agent_confidence_deduplicates_factors(self):
+        """Test agent confidence reports each severity factor once."""
+        delusions = [
+            {"confidence": 0.5, "severity": "low"},
+            {"confidence": 0.5, "severity": "high"},
+        ] * 50
+
+        confidence = ConfidenceCalculator.calculate_agent_confidence(delusions)
+        assert confidence.factors == ["high_severity_penalty", "low_severity_penalty"]
+        assert confidence.metadata["delusion_count"] == 100
+
+    def test_calculate_agent_confidence_is_clamped(self):
+        """Test agent confidence stays within range for boosted severities."""
+        delusions = [{"confidence": 0.95, "severity": "high"}] * 3
+
+        confidence = ConfidenceCalculator.calculate_agent_confidence(delusions)
+        assert isinstance(confidence, ConfidenceScore)
+        assert confidence.value == 1.0
+        assert confidence.metadata["delusion_count"] == 3
+
+    def test_calculate_agent_confidence_nan(self):
+        """Test a NaN delusion confidence is rejected."""
+        with pytest.raises(ValueError):
+            ConfidenceCalculator.calculate_agent_confidence(
+                [{"confidence": float("nan")}]
+            )
+
     def test_calculate_recovery_confidence_no_changes(self):
         """Test recovery confidence calculation with no changes."""
         confidence = ConfidenceCalculator.calculate_recovery_confidence([])
@@ -108,6 +135,16 @@ class TestConfidenceCalculator:
         assert "factor2" in combined.factors
         assert combined.metadata["score_count"] == 2
 
+    def test_combine_confidence_scores_deduplicates_factors(self):
+        """Test combined factors keep first-seen order without duplicates."""
+        scores = [
+            ConfidenceScore(value=0.8, factors=["factor1", "shared"]),
+            ConfidenceScore(value=0.6, factors=["shared", "factor2"]),
+        ]
+
+        combined = ConfidenceCalculator.combine_confidence_scores(scores)
+        assert combined.factors == ["factor1", "shared", "factor2"]
+
     def test_combine_confidence_scores_with_weights(self):
         """Test combining confidence scores with weights."""
         scores = [
@@ -133,6 +170,39 @@ class TestConfidenceCalculator:
         ):
             ConfidenceCalculator.combine_confidence_scores(scores, weights)
 
+    def test_combine_confidence_scores_zero_weights(self):
+        """Test combining confidence scores with weights that sum to zero."""
+        scores = [
+            ConfidenceScore(value=0.8, factors=["factor1"]),
+            ConfidenceScore(value=0.6, factors=["factor2"]),
+        ]
+
+        with pytest.raises(ValueError, match="Weights must sum to a positive value"):
+            ConfidenceCalculator.combine_confidence_scores(scores, [0.0, 0.0])
+
+    def test_combine_confidence_scores_tiny_weights(self):
+        """Test tiny but positive weights are normalized, not rejected."""
+        scores = [
+            ConfidenceScore(value=0.8, factors=["factor1"]),
+            ConfidenceScore(value=0.6, factors=["factor2"]),
+        ]
+
+        combined = ConfidenceCalculator.combine_confidence_scores(
+            scores, [1e-13, 1e-13]
+        )
+        assert combined.value == pytest.approx(0.7)
+        assert combined.metadata["weights"] == pytest.approx([0.5, 0.5])
+
+    def test_combine_confidence_scores_nan_weight(self):
+        """Test combining confidence scores with a NaN weight is rejected."""
+        scores = [
+            ConfidenceScore(value=0.8, factors=["factor1"]),
+            ConfidenceScore(value=0.6, factors=["factor2"]),
+        ]
+
+        with pytest.raises(ValueError, match="NaN"):
+            ConfidenceCalculator.combine_confidence_scores(scores, [float("nan"), 1.0])
+
     def test_combine_confidence_scores_empty(self):
         """Test combining empty confidence scores."""
         combined = ConfidenceCalculator.combine_confidence_scores([])
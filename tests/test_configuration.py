@@ -0,0 +1,178 @@
+"""
+Tests for the configuration management module.
+"""
+
+import subprocess
+import sys
+import threading
+import uuid
+from multiprocessing import resource_tracker
+
+import pytest
+from clewcrew_common.configuration import ConfigManager
+
+KEY = "CLEWCREW_TEST_VALUE"
+OTHER_KEY = "CLEWCREW_TEST_OTHER"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A fresh ConfigManager with the test keys set in the environment."""
+    monkeypatch.setenv(KEY, "1")
+    monkeypatch.setenv(OTHER_KEY, "a")
+    return ConfigManager()
+
+
+class TestConfigManagerCache:
+    """Test caching of environment lookups in ConfigManager.get."""
+
+    def test_cache_hit_after_env_change(self, manager, monkeypatch):
+        """Test a cached value is returned after the environment changes."""
+        assert manager.get(KEY) == "1"
+        monkeypatch.setenv(KEY, "2")
+        assert manager.get(KEY) == "1"
+
+    def test_default_is_not_cached(self, manager, monkeypatch):
+        """Test a missing key falls back to the per-call default."""
+        monkeypatch.delenv(KEY)
+        assert manager.get(KEY, default="x") == "x"
+        assert manager.get(KEY, default="y") == "y"
+        monkeypatch.setenv(KEY, "3")
+        assert manager.get(KEY, default="y") == "3"
+
+    def test_invalidate_key(self, manager, monkeypatch):
+        """Test invalidate(key) drops only that key."""
+        manager.get(KEY)
+        manager.get(OTHER_KEY)
+        monkeypatch.setenv(KEY, "2")
+        monkeypatch.setenv(OTHER_KEY, "b")
+
+        manager.invalidate(KEY)
+        assert manager.get(KEY) == "2"
+        assert manager.get(OTHER_KEY) == "a"
+
+    def test_invalidate_all(self, manager, monkeypatch):
+        """Test invalidate() drops every cached key."""
+        manager.get(KEY)
+        manager.get(OTHER_KEY)
+        monkeypatch.setenv(KEY, "2")
+        monkeypatch.setenv(OTHER_KEY, "b")
+
+        manager.invalidate()
+        assert manager.get(KEY) == "2"
+        assert manager.get(OTHER_KEY) == "b"
+
+    def test_set_invalidates_key(self, manager, monkeypatch):
+        """Test set() drops the cached environment value for its key."""
+        manager.get(KEY)
+        monkeypatch.setenv(KEY, "2")
+
+        manager.set(KEY, "manual")
+        assert manager.get(KEY) == "2"
+        assert manager.has(KEY)
+
+    def test_entries_per_type_hint(self, manager, monkeypatch):
+        """Test each type_hint gets its own converted cache entry."""
+        assert manager.get(KEY) == "1"
+        assert manager.get(KEY, type_hint=int) == 1
+        assert manager.get(KEY, type_hint=bool) is True
+
+        monkeypatch.setenv(KEY, "0")
+        assert manager.get(KEY, type_hint=int) == 1
+        assert manager.get(KEY, type_hint=float) == 0.0
+
+
+@pytest.fixture
+def snapshot_name():
+    """A unique shared memory block name for one test."""
+    return f"clewcrew_test_{uuid.uuid4().hex[:12]}"
+
+
+class TestConfigManagerSnapshot:
+    """Test sharing configuration through snapshot() and attach()."""
+
+    def test_round_trip(self, manager, snapshot_name, monkeypatch):
+        """Test attach() restores set() values and type_hint-converted values."""
+        assert manager.get(KEY, type_hint=int) == 1
+        assert manager.get(KEY, type_hint=bool) is True
+        manager.set("MANUAL", "value")
+
+        name = manager.snapshot(snapshot_name)
+        try:
+            monkeypatch.setenv(KEY, "5")
+            attached = ConfigManager.attach(name)
+        finally:
+            manager.release_snapshot()
+
+        assert attached.get(KEY, type_hint=int) == 1
+        assert attached.get(KEY, type_hint=bool) is True
+        assert attached.get(KEY, type_hint=float) == 5.0
+        assert attached.has("MANUAL")
+
+    def test_release_snapshot(self, manager, snapshot_name):
+        """Test a released snapshot can no longer be attached."""
+        manager.snapshot(snapshot_name)
+        manager.release_snapshot()
+
+        with pytest.raises(FileNotFoundError):
+            ConfigManager.attach(snapshot_name)
+        manager.release_snapshot()
+
+    def test_snapshot_name_in_use(self, manager, snapshot_name):
+        """Test a second snapshot under a taken name raises a clear error."""
+        manager.snapshot(snapshot_name)
+        try:
+            with pytest.raises(FileExistsError, match="already exists"):
+                ConfigManager().snapshot(snapshot_name)
+        finally:
+            manager.release_snapshot()
+
+    def test_concurrent_attach_restores_register(self, manager, snapshot_name):
+        """Test attaching from several threads leaves resource tracking intact."""
+        register = resource_tracker.register
+        manager.snapshot(snapshot_name)
+        errors = []
+
+        def attach_many():
+            try:
+                for _ in range(50):
+                    ConfigManager.attach(snapshot_name)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=attach_many) for _ in range(4)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            manager.release_snapshot()
+
+        assert errors == []
+        assert resource_tracker.register is register
+
+    def test_attach_from_independent_processes(self, manager, snapshot_name):
+        """Test one process exiting after attach does not remove the snapshot."""
+        manager.get(KEY, type_hint=int)
+        manager.snapshot(snapshot_name)
+        code = (
+            "from clewcrew_common.configuration import ConfigManager; "
+            f"print(ConfigManager.attach({snapshot_name!r}).get({KEY!r}, type_hint=int))"
+        )
+        try:
+            for _ in range(2):
+                result = subprocess.run(
+                    [sys.executable, "-c", code],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                assert result.stdout.strip() == "1"
+                assert "leaked" not in result.stderr
+        finally:
+            manager.release_snapshot()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,144 @@
+"""
+Tests for the file operations module.
+"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from clewcrew_common import file_ops
+from clewcrew_common.file_ops import FileOperations
+
+
+class TestReadFileSafe:
+    """Test FileOperations.read_file_safe."""
+
+    def test_reads_utf8(self, tmp_path):
+        """Test UTF-8 content is decoded."""
+        path = tmp_path / "text.txt"
+        path.write_bytes("héllo wörld\n".encode("utf-8"))
+        assert FileOperations.read_file_safe(str(path)) == "héllo wörld\n"
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file reads as an empty string."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert FileOperations.read_file_safe(str(path)) == ""
+
+    def test_normalizes_newlines(self, tmp_path):
+        """Test CRLF and CR line endings are translated like read_text."""
+        path = tmp_path / "newlines.txt"
+        path.write_bytes(b"a\r\nb\rc\n")
+        assert FileOperations.read_file_safe(str(path)) == "a\nb\nc\n"
+        assert FileOperations.read_file_safe(str(path)) == path.read_text(
+            encoding="utf-8"
+        )
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises IOError with the not-found message."""
+        path = tmp_path / "missing.txt"
+        with pytest.raises(IOError, match=f"File not found: {path}"):
+            FileOperations.read_file_safe(str(path))
+
+    def test_directory(self, tmp_path):
+        """Test a directory argument raises IOError."""
+        with pytest.raises(IOError, match=f"Error reading file {tmp_path}"):
+            FileOperations.read_file_safe(str(tmp_path))
+
+    def test_short_st_size(self, tmp_path, monkeypatch):
+        """Test a file whose st_size under-reports its length is read fully."""
+        path = tmp_path / "growing.txt"
+        path.write_text("0123456789" * 10000)
+        real_fstat = os.fstat
+        monkeypatch.setattr(file_ops.os, "fstat", lambda fd: SimpleNamespace(st_size=3))
+        try:
+            content = FileOperations.read_file_safe(str(path))
+        finally:
+            monkeypatch.setattr(file_ops.os, "fstat", real_fstat)
+        assert content == "0123456789" * 10000
+
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/self/status"), reason="requires procfs"
+    )
+    def test_zero_st_size_proc_file(self):
+        """Test a /proc file reporting st_size 0 is still read."""
+        assert os.stat("/proc/self/status").st_size == 0
+        assert "Name:" in FileOperations.read_file_safe("/proc/self/status")
+
+    def test_large_file_fallback(self, tmp_path, monkeypatch):
+        """Test files above the single-read limit are read through pathlib."""
+        path = tmp_path / "large.txt"
+        path.write_bytes(b"line\r\n" * 100)
+        monkeypatch.setattr(file_ops, "_SINGLE_READ_LIMIT", 16)
+        calls = []
+        real_read_bytes = Path.read_bytes
+
+        def read_bytes(self):
+            calls.append(self)
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", read_bytes)
+        assert FileOperations.read_file_safe(str(path)) == "line\n" * 100
+        assert calls == [path]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A directory with matching files, a non-match, a subdirectory and a symlink."""
+    (tmp_path / "a.py").write_text("a")
+    (tmp_path / "b.py").write_text("b")
+    (tmp_path / "notes.txt").write_text("notes")
+    package = tmp_path / "package.py"
+    package.mkdir()
+    (package / "inner.py").write_text("inner")
+    os.symlink(tmp_path / "a.py", tmp_path / "link.py")
+    return tmp_path
+
+
+class TestListFiles:
+    """Test FileOperations.list_files."""
+
+    def test_lists_matching_files(self, tree):
+        """Test files matching the pattern are listed as Paths under the directory."""
+        files = FileOperations.list_files(str(tree))
+        assert sorted(files) == sorted([tree / "a.py", tree / "b.py", tree / "link.py"])
+
+    def test_excludes_matching_directory(self, tree):
+        """Test a subdirectory whose name matches the pattern is skipped."""
+        assert tree / "package.py" not in FileOperations.list_files(str(tree))
+
+    def test_includes_symlinked_files(self, tree):
+        """Test a symlink to a file is listed."""
+        assert tree / "link.py" in FileOperations.list_files(str(tree))
+
+    def test_custom_pattern(self, tree):
+        """Test a non-default pattern."""
+        assert FileOperations.list_files(str(tree), "*.txt") == [tree / "notes.txt"]
+
+    @pytest.mark.parametrize("directory", ["", "."])
+    def test_current_directory(self, tree, monkeypatch, directory):
+        """Test the empty path and "." both list the current directory."""
+        monkeypatch.chdir(tree)
+        files = FileOperations.list_files(directory)
+        assert sorted(files) == [Path("a.py"), Path("b.py"), Path("link.py")]
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory yields an empty list."""
+        assert FileOperations.list_files(str(tmp_path / "missing")) == []
+
+    def test_recursive_pattern(self, tree):
+        """Test a ** pattern recurses and still returns only files."""
+        files = FileOperations.list_files(str(tree), "**/*.py")
+        assert sorted(files) == sorted(
+            [
+                tree / "a.py",
+                tree / "b.py",
+                tree / "link.py",
+                tree / "package.py" / "inner.py",
+            ]
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
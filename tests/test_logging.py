@@ -0,0 +1,43 @@
+"""
+Tests for the logging framework module.
+"""
+
+import io
+from contextlib import redirect_stdout
+
+import pytest
+from clewcrew_common.logging import ClewcrewLogger
+
+
+class TestClewcrewLogger:
+    """Test the ClewcrewLogger class."""
+
+    def test_logger_created_under_redirect(self):
+        """Test a logger built under redirect_stdout writes to the redirect."""
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            logger = ClewcrewLogger("test-redirect")
+            logger.info("redirected", {"key": "value"})
+
+        assert "redirected | Context: {'key': 'value'}" in buffer.getvalue()
+
+    def test_shared_handler_follows_stdout(self, capsys):
+        """Test loggers sharing the handler write to the current stdout."""
+        ClewcrewLogger("test-capsys-a").warning("first")
+        ClewcrewLogger("test-capsys-b").error("second")
+
+        out = capsys.readouterr().out
+        assert "ghostbusters.test-capsys-a - WARNING - first | Severity: medium" in out
+        assert "ghostbusters.test-capsys-b - ERROR - second" in out
+
+    def test_repeated_construction_reuses_handler(self):
+        """Test re-instantiating a component does not add handlers."""
+        first = ClewcrewLogger("test-repeat")
+        second = ClewcrewLogger("test-repeat")
+
+        assert first.logger is second.logger
+        assert len(second.logger.handlers) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,74 @@
+"""
+Tests for the validation utilities module.
+"""
+
+import pytest
+from clewcrew_common.validation import ValidationUtils
+
+
+class TestValidateEmail:
+    """Test ValidationUtils.validate_email."""
+
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "john.doe@example.com",
+            "first+tag@sub.example.co.uk",
+            "a_b%c-d@my-domain.io",
+            "x@y.org",
+        ],
+    )
+    def test_valid_addresses(self, email):
+        """Test well-formed addresses are accepted."""
+        assert ValidationUtils.validate_email(email)
+
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "",
+            "plainaddress",
+            "@example.com",
+            "user@",
+            "user@example",
+            "user@example.c",
+            "user@@example.com",
+            "user name@example.com",
+            "user@example.c0m",
+            "user@exa_mple.com",
+        ],
+    )
+    def test_invalid_addresses(self, email):
+        """Test malformed addresses are rejected."""
+        assert not ValidationUtils.validate_email(email)
+
+    def test_trailing_newline_rejected(self):
+        """Test a trailing newline is not accepted as end of the address."""
+        assert not ValidationUtils.validate_email("a@b.com\n")
+        assert ValidationUtils.filter_valid_emails(["a@b.com\n"]) == []
+
+
+class TestFilterValidEmails:
+    """Test ValidationUtils.filter_valid_emails."""
+
+    def test_keeps_valid_addresses_in_order(self):
+        """Test only valid addresses are kept, in input order."""
+        emails = ["b@example.org", "not-an-email", "a@example.com", "c@", "z@y.io"]
+
+        assert ValidationUtils.filter_valid_emails(emails) == [
+            "b@example.org",
+            "a@example.com",
+            "z@y.io",
+        ]
+
+    def test_accepts_any_iterable(self):
+        """Test a generator input is filtered the same way."""
+        emails = (email for email in ["a@example.com", "bad"])
+        assert ValidationUtils.filter_valid_emails(emails) == ["a@example.com"]
+
+    def test_empty_input(self):
+        """Test empty input returns an empty list."""
+        assert ValidationUtils.filter_valid_emails([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])